@@ -16,20 +16,50 @@ class ByteBeastDB:
     """SQLite database manager for ByteBeast."""
     
     def __init__(self, db_path: str = "/home/jerry/bytebeast.db"):
-        """Initialize database connection."""
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        """Initialize database connection.
+
+        Pass ':memory:' for an in-memory database (used by tests); it lives
+        and dies with a single persistent connection since every new
+        connection to ':memory:' would get its own empty database.
+        """
+        self._memory_conn = None
+        if str(db_path) == ':memory:':
+            self._memory_conn = sqlite3.connect(':memory:')
+            self._memory_conn.row_factory = sqlite3.Row
+        else:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.init_database()
-    
+
     @contextmanager
     def get_connection(self):
         """Context manager for database connections."""
+        if self._memory_conn is not None:
+            yield self._memory_conn
+            return
+
         conn = sqlite3.connect(str(self.db_path))
         conn.row_factory = sqlite3.Row  # Enable dict-like access
+        # WAL avoids writer-blocks-reader stalls and NORMAL sync skips the
+        # per-commit fsync; both are safe for this append-mostly workload
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
         try:
             yield conn
         finally:
             conn.close()
+
+    @contextmanager
+    def transaction(self):
+        """Context manager batching many writes into a single commit.
+
+        Pass the yielded connection to the save_* methods to avoid one
+        commit (and fsync) per row when writing in bulk.
+        """
+        with self.get_connection() as conn:
+            yield conn
+            conn.commit()
     
     def init_database(self):
         """Initialize database tables."""
@@ -85,24 +115,45 @@ class ByteBeastDB:
             
             conn.commit()
     
-    def save_beast_state(self, beast: Beast):
-        """Save current beast state snapshot."""
+    @staticmethod
+    def _beast_row(beast: Beast) -> tuple:
+        """Serialize a beast snapshot to a (json, ts) insert row."""
         beast_data = {
             'mood': beast.mood,
-            'needs': beast.needs,
-            'traits': beast.traits, 
+            'needs': dict(beast.needs),
+            'traits': dict(beast.traits),
             'evolution_path': beast.evolution_path,
             'evolution_stage': beast.evolution_stage,
             'evolution_prog': beast.evolution_prog,
             'energy': beast.energy,
             'last_updated': beast.last_updated
         }
-        
+        return (json.dumps(beast_data), int(time.time()))
+
+    def save_beast_state(self, beast: Beast, conn: Optional[sqlite3.Connection] = None):
+        """Save current beast state snapshot.
+
+        When called inside a transaction() block, pass the open connection
+        to defer the commit to the end of the batch.
+        """
+        row = self._beast_row(beast)
+
+        if conn is not None:
+            conn.execute('INSERT INTO state_snapshot (json, ts) VALUES (?, ?)', row)
+            return
+
         with self.get_connection() as conn:
-            conn.execute(
-                'INSERT INTO state_snapshot (json, ts) VALUES (?, ?)',
-                (json.dumps(beast_data), int(time.time()))
-            )
+            conn.execute('INSERT INTO state_snapshot (json, ts) VALUES (?, ?)', row)
+            conn.commit()
+
+    def save_beast_state_batch(self, beasts: List[Beast]):
+        """Bulk-insert beast snapshots with executemany in one transaction."""
+        if not beasts:
+            return
+
+        rows = [self._beast_row(beast) for beast in beasts]
+        with self.get_connection() as conn:
+            conn.executemany('INSERT INTO state_snapshot (json, ts) VALUES (?, ?)', rows)
             conn.commit()
     
     def load_latest_beast_state(self) -> Optional[Beast]:
@@ -118,8 +169,9 @@ class ByteBeastDB:
                 return Beast(**data)
             return None
     
-    def save_sensor_data(self, features: EnvFeatures):
-        """Save sensor feature data."""
+    @staticmethod
+    def _sensor_row(features: EnvFeatures) -> tuple:
+        """Serialize sensor features to a (json, ts) insert row."""
         features_data = {
             'lux': features.lux,
             'cct_k': features.cct_k,
@@ -140,12 +192,32 @@ class ByteBeastDB:
             'ssid_fingerprint': features.ssid_fingerprint,
             'timestamp': features.timestamp
         }
-        
+        return (json.dumps(features_data), int(features.timestamp))
+
+    def save_sensor_data(self, features: EnvFeatures, conn: Optional[sqlite3.Connection] = None):
+        """Save sensor feature data.
+
+        When called inside a transaction() block, pass the open connection
+        to defer the commit to the end of the batch.
+        """
+        row = self._sensor_row(features)
+
+        if conn is not None:
+            conn.execute('INSERT INTO history_sense (json, ts) VALUES (?, ?)', row)
+            return
+
         with self.get_connection() as conn:
-            conn.execute(
-                'INSERT INTO history_sense (json, ts) VALUES (?, ?)',
-                (json.dumps(features_data), int(features.timestamp))
-            )
+            conn.execute('INSERT INTO history_sense (json, ts) VALUES (?, ?)', row)
+            conn.commit()
+
+    def save_sensor_data_batch(self, features_list: List[EnvFeatures]):
+        """Bulk-insert sensor rows with executemany in one transaction."""
+        if not features_list:
+            return
+
+        rows = [self._sensor_row(features) for features in features_list]
+        with self.get_connection() as conn:
+            conn.executemany('INSERT INTO history_sense (json, ts) VALUES (?, ?)', rows)
             conn.commit()
     
     def get_recent_sensor_data(self, hours: int = 24) -> List[EnvFeatures]:
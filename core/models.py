@@ -2,10 +2,67 @@
 Core data models for ByteBeast virtual pet.
 """
 
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
 from typing import Optional, Dict, List
 import time
 
+import numpy as np
+
+# Fixed storage order for the Beast score vectors
+NEED_KEYS = ('hunger', 'rest', 'social', 'hygiene')
+TRAIT_KEYS = ('playful', 'needy', 'rebellious', 'social', 'explorer')
+_NEED_INDEX = {key: i for i, key in enumerate(NEED_KEYS)}
+_TRAIT_INDEX = {key: i for i, key in enumerate(TRAIT_KEYS)}
+
+
+class ArrayMapping(MutableMapping):
+    """Dict-style view over a fixed-key NumPy vector.
+
+    Beast stores needs and traits as contiguous float arrays (structure of
+    arrays) so the engine can clamp and drift them with single vector ops,
+    while existing dict-style access like beast.needs['hunger'] keeps
+    working. The key set is fixed at construction; values() returns the
+    backing array itself for cheap aggregation.
+    """
+
+    __slots__ = ('_keys', '_index', 'arr')
+
+    def __init__(self, keys, index, values):
+        self._keys = keys
+        self._index = index
+        self.arr = np.array([values[key] for key in keys], dtype=np.float64)
+
+    def __getitem__(self, key):
+        return self.arr[self._index[key]]
+
+    def __setitem__(self, key, value):
+        self.arr[self._index[key]] = value
+
+    def __delitem__(self, key):
+        raise TypeError("ArrayMapping has a fixed key set")
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def values(self):
+        """The backing vector itself - sum()/min()/iteration are all O(n)
+        over contiguous floats with no per-key hashing."""
+        return self.arr
+
+    def __repr__(self):
+        return f"ArrayMapping({dict(self)!r})"
+
+    def __deepcopy__(self, memo):
+        clone = ArrayMapping.__new__(ArrayMapping)
+        clone._keys = self._keys
+        clone._index = self._index
+        clone.arr = self.arr.copy()
+        return clone
+
 
 @dataclass
 class EnvFeatures:
@@ -60,19 +117,34 @@ class Beast:
 
     def __post_init__(self):
         """Validate ranges."""
-        # Clamp needs to 0-100
-        for need, value in self.needs.items():
-            self.needs[need] = max(0.0, min(100.0, value))
-        
-        # Clamp traits to 0-1
-        for trait, value in self.traits.items():
-            self.traits[trait] = max(0.0, min(1.0, value))
-        
+        # Novelty-tracking slots, refreshed by MoodEngine._detect_novelty;
+        # _novelty_env/_novelty latch the verdict for one environment
+        # sample so every stage of a pass shares the same boolean
+        self._last_lux = 0.0
+        self._last_fingerprint = ''
+        self._novelty_env = None
+        self._novelty = False
+
+        # Move needs/traits into the SoA vector views (plain dicts arrive
+        # here from JSON loads and the default factories)
+        if not isinstance(self.needs, ArrayMapping):
+            self.needs = ArrayMapping(NEED_KEYS, _NEED_INDEX, self.needs)
+        if not isinstance(self.traits, ArrayMapping):
+            self.traits = ArrayMapping(TRAIT_KEYS, _TRAIT_INDEX, self.traits)
+
+        # Clamp needs to 0-100 and traits to 0-1
+        np.clip(self.needs.arr, 0.0, 100.0, out=self.needs.arr)
+        np.clip(self.traits.arr, 0.0, 1.0, out=self.traits.arr)
+
         # Clamp other values
         self.evolution_stage = max(1, min(4, self.evolution_stage))
         self.evolution_prog = max(0.0, min(1.0, self.evolution_prog))
         self.energy = max(0.0, min(100.0, self.energy))
 
+        # Cached aggregate, kept current by the needs tick so status logging
+        # doesn't re-sum the dict
+        self._needs_sum = float(self.needs.arr.sum())
+
 
 @dataclass  
 class EmojiFrame:
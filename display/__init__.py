@@ -0,0 +1,3 @@
+"""
+Display rendering and LCD output for ByteBeast.
+"""
@@ -0,0 +1,3 @@
+"""
+Vendored LCD driver modules and packing helpers (deployed on-device).
+"""
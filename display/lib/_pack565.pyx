@@ -0,0 +1,23 @@
+# cython: language_level=3
+"""
+RGB888 -> RGB565 pack loop for display framebuffers.
+
+Optional fast path for the display test scripts; build on-device with
+`cythonize -i _pack565.pyx`. Callers fall back to the NumPy packer when
+the extension isn't compiled.
+"""
+
+import cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def pack(const unsigned char[:, :, ::1] rgb, unsigned short[:, ::1] out):
+    """Pack an HxWx3 RGB byte array into native-endian RGB565 values."""
+    cdef Py_ssize_t i, j
+    with nogil:
+        for i in range(rgb.shape[0]):
+            for j in range(rgb.shape[1]):
+                out[i, j] = (((rgb[i, j, 0] & 0xF8) << 8) |
+                             ((rgb[i, j, 1] & 0xFC) << 3) |
+                             (rgb[i, j, 2] >> 3))
@@ -0,0 +1,58 @@
+/*
+ * RGB888 -> RGB565 packer with ARM NEON intrinsics.
+ *
+ * Optional fast path for the display test scripts; build on-device with
+ *
+ *   gcc -O3 -march=armv8-a+simd -shared -fPIC pack565_neon.c -o pack565_neon.so
+ *
+ * Callers load it via ctypes and fall back to the Python packers when the
+ * shared object isn't built. Output is native-endian RGB565; byte order
+ * for the panel is handled by the caller.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#ifdef __ARM_NEON
+#include <arm_neon.h>
+
+void pack565(const uint8_t *rgb, uint16_t *out, size_t n)
+{
+    size_t i = 0;
+
+    /* 16 pixels per iteration: vld3q deinterleaves the RGB planes, then
+     * each half is packed with the classic shift-left-long + shift-right-
+     * insert sequence (r in bits 15:11, g in 10:5, b in 4:0). */
+    for (; i + 16 <= n; i += 16, rgb += 48, out += 16) {
+        uint8x16x3_t v = vld3q_u8(rgb);
+
+        uint16x8_t lo = vshll_n_u8(vget_low_u8(v.val[0]), 8);
+        lo = vsriq_n_u16(lo, vshll_n_u8(vget_low_u8(v.val[1]), 8), 5);
+        lo = vsriq_n_u16(lo, vshll_n_u8(vget_low_u8(v.val[2]), 8), 11);
+        vst1q_u16(out, lo);
+
+        uint16x8_t hi = vshll_n_u8(vget_high_u8(v.val[0]), 8);
+        hi = vsriq_n_u16(hi, vshll_n_u8(vget_high_u8(v.val[1]), 8), 5);
+        hi = vsriq_n_u16(hi, vshll_n_u8(vget_high_u8(v.val[2]), 8), 11);
+        vst1q_u16(out + 8, hi);
+    }
+
+    /* Scalar tail (240*240 is a multiple of 16, so normally empty). */
+    for (; i < n; i++, rgb += 3, out++)
+        *out = (uint16_t)(((rgb[0] & 0xF8) << 8) |
+                          ((rgb[1] & 0xFC) << 3) |
+                          (rgb[2] >> 3));
+}
+
+#else /* scalar fallback for non-NEON builds */
+
+void pack565(const uint8_t *rgb, uint16_t *out, size_t n)
+{
+    size_t i;
+    for (i = 0; i < n; i++, rgb += 3, out++)
+        *out = (uint16_t)(((rgb[0] & 0xF8) << 8) |
+                          ((rgb[1] & 0xFC) << 3) |
+                          (rgb[2] >> 3));
+}
+
+#endif
@@ -5,14 +5,140 @@ Implements rule-based mood detection based on environmental sensors
 and beast internal state.
 """
 
+import copy
 import time
 import logging
+
+import numpy as np
+from itertools import islice
 from typing import Dict, List, Optional
 from core.models import EnvFeatures, Beast, MOOD_EMOJIS, EVOLUTION_PATHS
 from core.config import get_config
 
+# Numba is optional on-device; without it the rule kernel runs interpreted
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Mood names indexed by the integer returned from _infer_mood_kernel
+_MOOD_NAMES = ('hot', 'cold', 'sick', 'sleepy', 'playful',
+               'happy', 'curious', 'bored', 'anxious', 'calm')
+
+
+def _infer_mood_kernel(temp_c, lux, motion, shake, vbat, rh, pressure_trend,
+                       energy, needs_min, social_need, novelty,
+                       temp_hot, temp_cold, comfort_lo, comfort_hi,
+                       lux_dark, lux_bright, motion_full, motion_half,
+                       motion_quarter, low_voltage, pressure_stable,
+                       pressure_stable2):
+    """Pack the mood rule conditions into a bitmask (bit N = rule N fires).
+
+    Branch-free bit-OR chain; rule priority is resolved by _MOOD_LUT at
+    the lookup. Kept free of Python objects so Numba can JIT it.
+    """
+    mask = 0
+    # 1. Hot / 2. Cold - immediate environmental response
+    mask |= (temp_c >= temp_hot) << 0
+    mask |= (temp_c <= temp_cold) << 1
+    # 3. Sick - battery, health, or extreme environment
+    mask |= (vbat < low_voltage or energy < 20 or
+             abs(pressure_trend) > pressure_stable2 or
+             rh > 90 or rh < 10) << 2
+    # 4. Sleepy - dark and low motion with low energy (sustained heuristic)
+    mask |= (lux < lux_dark and motion < motion_quarter and energy < 40) << 3
+    # 5. Playful - shake bursts or high activity
+    mask |= (shake > 0 or motion > motion_full) << 4
+    # 6. Happy - bright and comfortable with energy to spare
+    mask |= (lux > lux_bright and comfort_lo <= temp_c <= comfort_hi and
+             energy > 60) << 5
+    # 7. Curious - environmental novelty (detected at the Python boundary)
+    mask |= novelty << 6
+    # 8. Bored - low motion and low social need (sustained heuristic)
+    mask |= (motion < motion_half and social_need < 40) << 7
+    # 9. Anxious - unstable environment or any need running low
+    mask |= (abs(pressure_trend) > pressure_stable or shake > 3 or
+             needs_min < 30) << 8
+    return mask
+
+
+if _HAVE_NUMBA:
+    _infer_mood_kernel = njit(cache=True)(_infer_mood_kernel)
+
+
+def _build_mood_lut():
+    """Map each 9-bit rule mask to its winning mood index.
+
+    First match wins, so the lowest set bit decides; an empty mask falls
+    back to calm. Enumerated once at import - mood dispatch is then a
+    single tuple index regardless of rule count.
+    """
+    lut = []
+    for mask in range(512):
+        lut.append((mask & -mask).bit_length() - 1 if mask else 9)
+    return tuple(lut)
+
+
+_MOOD_LUT = _build_mood_lut()
+
+
+# Task structures are static, so share module-level templates instead of
+# rebuilding dicts on every generate_tasks call. Plain dicts, not proxies:
+# log_event serializes tasks with json.dumps. Callers must treat tasks as
+# read-only and copy with dict(task) if they ever need to mutate one.
+_TASK_FEED = {
+    'type': 'care',
+    'action': 'feed',
+    'description': 'Feed your ByteBeast',
+    'reward': {'hunger': 20}
+}
+_TASK_QUIET = {
+    'type': 'environment',
+    'action': 'quiet_time',
+    'description': 'Find a quiet spot for 15 minutes',
+    'reward': {'rest': 15}
+}
+_TASK_MEET = {
+    'type': 'social',
+    'action': 'meet_peer',
+    'description': 'Take your ByteBeast to meet others',
+    'reward': {'social': 25}
+}
+_TASK_CLEAN = {
+    'type': 'care',
+    'action': 'clean',
+    'description': 'Keep your ByteBeast in comfortable conditions',
+    'reward': {'hygiene': 20}
+}
+_TASK_EXPLORE = {
+    'type': 'exploration',
+    'action': 'new_location',
+    'description': 'Take your ByteBeast somewhere new',
+    'reward': {'explorer_xp': 10}
+}
+_TASK_PLAY = {
+    'type': 'activity',
+    'action': 'play_session',
+    'description': 'Have an active play session (shake/move around)',
+    'reward': {'playful_xp': 10}
+}
+_TASK_BRIGHT = {
+    'type': 'environment',
+    'action': 'bright_spot',
+    'description': 'Find a bright spot for 10 minutes',
+    'reward': {'energy': 10}
+}
+
+_NEED_TASKS = {
+    'hunger': _TASK_FEED,
+    'rest': _TASK_QUIET,
+    'social': _TASK_MEET,
+    'hygiene': _TASK_CLEAN
+}
+
 
 class MoodEngine:
     """Rule-based mood inference engine."""
@@ -21,377 +147,347 @@ class MoodEngine:
         """Initialize mood engine."""
         self.config = get_config()
         self.thresholds = self.config.thresholds
-        
+
+        # Cache hot-path threshold values so per-tick rule evaluation
+        # avoids repeated dict lookups and divisions
+        motion = self.thresholds['motion_active_g']
+        self._motion_full = motion
+        self._motion_half = motion * 0.5
+        self._motion_quarter = motion * 0.25
+        self._temp_comfort_lo = self.thresholds['temp_cold'] + 5
+        self._temp_comfort_hi = self.thresholds['temp_hot'] - 5
+        self._temp_hot = self.thresholds['temp_hot']
+        self._temp_cold = self.thresholds['temp_cold']
+        self._lux_dark = self.thresholds['lux_dark']
+        self._lux_bright = self.thresholds['lux_bright']
+        self._pressure_stable = self.thresholds.get('pressure_stable', 2.0)
+        self._pressure_stable2 = self._pressure_stable * 2
+        self._low_voltage = self.config.power['low_voltage']
+
+        # Evolution config is immutable across ticks; hoist the lookups too
+        evolution = self.config.evolution
+        self._progression_rate = evolution.get('progression_rate', 0.01)
+        self._stage_goal = evolution.get('stage_goal', 1.0)
+
     def infer_mood(self, env: EnvFeatures, beast: Beast) -> str:
         """Infer mood from environment and beast state using rule priority."""
-        
-        # Rule order: first match wins, else fallback by needs
-        
-        # 1. Hot rule - immediate environmental response
-        if env.temp_c >= self.thresholds['temp_hot']:
-            return 'hot'
-        
-        # 2. Cold rule - immediate environmental response  
-        if env.temp_c <= self.thresholds['temp_cold']:
-            return 'cold'
-        
-        # 3. Sick rule - battery or health issues
-        if (env.vbat < self.config.power['low_voltage'] or 
-            beast.energy < 20 or
-            self._is_environmental_extreme(env)):
-            return 'sick'
-        
-        # 4. Sleepy rule - dark and low motion for extended time
-        if (env.lux < self.thresholds['lux_dark'] and 
-            env.motion_rms_g < (self.thresholds['motion_active_g'] / 4) and
-            self._is_sustained_condition(env, beast, 'sleepy')):
-            return 'sleepy'
-        
-        # 5. Playful rule - shake bursts or high activity
-        if (env.shake_events > 0 or 
-            env.motion_rms_g > self.thresholds['motion_active_g']):
-            return 'playful'
-        
-        # 6. Happy rule - bright and comfortable conditions
-        if (env.lux > self.thresholds['lux_bright'] and
-            self._is_comfortable_temperature(env.temp_c) and
-            beast.energy > 60):
-            return 'happy'
-        
-        # 7. Curious rule - environmental novelty
-        if self._detect_novelty(env, beast):
-            return 'curious'
-        
-        # 8. Bored rule - no novelty and low motion for extended time
-        if (env.motion_rms_g < (self.thresholds['motion_active_g'] / 2) and
-            self._is_sustained_condition(env, beast, 'bored')):
-            return 'bored'
-        
-        # 9. Anxious rule - rapid environmental changes or low needs
-        if (self._is_environment_unstable(env) or 
-            any(need < 30 for need in beast.needs.values())):
-            return 'anxious'
-        
-        # 10. Default fallback - calm
-        return 'calm'
-    
-    def _is_environmental_extreme(self, env: EnvFeatures) -> bool:
-        """Check for extreme environmental conditions."""
-        return (abs(env.pressure_trend) > self.thresholds.get('pressure_stable', 2.0) * 2 or
-                env.rh > 90 or env.rh < 10)
-    
-    def _is_sustained_condition(self, env: EnvFeatures, beast: Beast, condition: str) -> bool:
-        """Check if condition has been sustained (simplified - would need history)."""
-        # This is a placeholder - in full implementation would check recent history
-        # For now, use a simple heuristic based on current state
-        if condition == 'sleepy':
-            return beast.energy < 40
-        elif condition == 'bored':
-            return beast.needs.get('social', 50) < 40
-        return False
-    
-    def _is_comfortable_temperature(self, temp_c: float) -> bool:
-        """Check if temperature is in comfortable range."""
-        return (self.thresholds['temp_cold'] + 5) <= temp_c <= (self.thresholds['temp_hot'] - 5)
-    
+        # _infer_mood_kernel packs the rule conditions into a bitmask and
+        # _MOOD_LUT resolves priority; only novelty detection stays here
+        needs = beast.needs
+        mask = _infer_mood_kernel(
+            env.temp_c, env.lux, env.motion_rms_g, env.shake_events,
+            env.vbat, env.rh, env.pressure_trend,
+            beast.energy, needs.arr.min(), needs['social'],
+            self._detect_novelty(env, beast),
+            self._temp_hot, self._temp_cold,
+            self._temp_comfort_lo, self._temp_comfort_hi,
+            self._lux_dark, self._lux_bright,
+            self._motion_full, self._motion_half, self._motion_quarter,
+            self._low_voltage, self._pressure_stable, self._pressure_stable2)
+        return _MOOD_NAMES[_MOOD_LUT[mask]]
+
     def _detect_novelty(self, env: EnvFeatures, beast: Beast) -> bool:
-        """Detect environmental novelty (simplified)."""
+        """Detect environmental novelty (simplified).
+
+        Evaluated once per environment sample and latched on the beast:
+        detection consumes the fingerprint/lux change, so the mood kernel,
+        needs drift, and explorer trait must all see the same boolean
+        whether they run fused through tick() or as separate calls.
+        """
+        if beast._novelty_env is env:
+            return beast._novelty
+
         # In full implementation, would compare with recent history
         # For now, use simple heuristics
-        
-        # Location novelty (WiFi fingerprint change)
-        if env.ssid_fingerprint != getattr(beast, '_last_fingerprint', ''):
-            return True
-        
+
+        # Location novelty (WiFi fingerprint change); the slot is always
+        # present on Beast, so read it directly instead of via getattr
+        novelty = env.ssid_fingerprint != beast._last_fingerprint
+
         # Large changes in heading or orientation
-        if env.shake_events > 2:
-            return True
-            
-        # Significant light changes
-        if hasattr(beast, '_last_lux'):
-            lux_change = abs(env.lux - beast._last_lux) / max(beast._last_lux, 1)
-            if lux_change > 0.5:  # 50% change
-                return True
-        
-        return False
-    
-    def _is_environment_unstable(self, env: EnvFeatures) -> bool:
-        """Check for rapidly changing environmental conditions."""
-        return (abs(env.pressure_trend) > self.thresholds.get('pressure_stable', 2.0) or
-                env.shake_events > 3)
+        novelty = novelty or env.shake_events > 2
+
+        # Significant light changes (>50% relative delta, rearranged to
+        # avoid the division: |lux - last| / max(last, 1) > 0.5)
+        prev = beast._last_lux if beast._last_lux > 1.0 else 1.0
+        novelty = novelty or abs(env.lux - beast._last_lux) * 2 > prev
+
+        # Record last-seen environment and latch the verdict for the rest
+        # of this pass
+        beast._last_fingerprint = env.ssid_fingerprint
+        beast._last_lux = env.lux
+        beast._novelty_env = env
+        beast._novelty = novelty
+        return novelty
     
+    def _env_context(self, env: EnvFeatures, beast: Beast) -> Dict:
+        """Evaluate the shared environment flags once per pass.
+
+        All three update stages branch on the same comparisons; computing
+        them here lets tick() traverse the environment a single time.
+        """
+        motion = env.motion_rms_g
+        return {
+            'active': motion > self._motion_full,
+            'calm_motion': motion < self._motion_half,
+            'quiet': motion < self._motion_quarter,
+            'bright': env.lux > self._lux_bright,
+            'dark': env.lux < self._lux_dark,
+            'hot': env.temp_c > self._temp_hot,
+            'cold': env.temp_c < self._temp_cold,
+            'comfortable': self._temp_comfort_lo <= env.temp_c <= self._temp_comfort_hi,
+            'shaken': env.shake_events > 0,
+            'novelty': self._detect_novelty(env, beast),
+        }
+
+    def step(self, env: EnvFeatures, beast: Beast, actions: Dict = None) -> Beast:
+        """Full per-tick update: mood inference plus the fused state pass.
+
+        Collapses the infer_mood -> update_needs -> tick_traits ->
+        update_evolution sequence every caller was writing by hand into a
+        single call that walks the environment once.
+        """
+        beast.mood = self.infer_mood(env, beast)
+        return self.tick(env, beast, actions)
+
+    def tick(self, env: EnvFeatures, beast: Beast, actions: Dict = None) -> Beast:
+        """Run needs, traits, and evolution updates in one fused pass.
+
+        Computes the shared environment flags once instead of three times
+        when the stages are invoked individually.
+        """
+        if actions is None:
+            actions = {}
+
+        ctx = self._env_context(env, beast)
+        self._update_needs_inner(beast, env, actions, ctx)
+        self._tick_traits_inner(env, beast, actions, ctx)
+        self._update_evolution_inner(env, beast, ctx)
+        return beast
+
     def update_needs(self, beast: Beast, env: EnvFeatures, actions: Dict = None) -> Beast:
         """Update beast needs based on time passage and actions."""
         if actions is None:
             actions = {}
-        
+        return self._update_needs_inner(beast, env, actions,
+                                        self._env_context(env, beast))
+
+    def _update_needs_inner(self, beast: Beast, env: EnvFeatures,
+                            actions: Dict, ctx: Dict) -> Beast:
+        """Needs update body, driven by precomputed environment flags."""
         current_time = time.time()
         time_delta = current_time - beast.last_updated
         hours_passed = time_delta / 3600.0
-        
+
         # Get base drift rates from config
         needs_config = self.config.needs
         base_rates = {
             'hunger': needs_config['hunger_base'],
-            'rest': needs_config['rest_base'], 
+            'rest': needs_config['rest_base'],
             'social': needs_config['social_base'],
             'hygiene': needs_config['hygiene_base']
         }
-        
-        # Apply need drift over time
-        for need, base_rate in base_rates.items():
-            # Adjust drift based on environmental factors
-            drift_rate = self._calculate_drift_rate(need, base_rate, env, beast)
-            
-            # Apply drift
-            beast.needs[need] -= drift_rate * hours_passed * needs_config['drift_rate']
-            
-            # Apply actions that satisfy needs
-            if need in actions:
-                beast.needs[need] += actions[need]
-        
-        # Environmental need satisfaction
-        beast.needs = self._apply_environmental_satisfaction(beast.needs, env)
-        
-        # Clamp needs to valid range
-        for need in beast.needs:
-            beast.needs[need] = max(0.0, min(100.0, beast.needs[need]))
-        
-        beast.last_updated = current_time
-        return beast
-    
-    def _calculate_drift_rate(self, need: str, base_rate: float, env: EnvFeatures, beast: Beast) -> float:
-        """Calculate adjusted drift rate based on conditions."""
-        rate = base_rate
-        
-        if need == 'hunger':
-            # Higher activity increases hunger
-            if env.motion_rms_g > self.thresholds['motion_active_g']:
-                rate *= 1.5
-                
-        elif need == 'rest':
+
+        # Adjust drift based on environmental factors
+        if ctx['active']:
+            # Higher activity increases hunger and rest need
+            base_rates['hunger'] *= 1.5
+            base_rates['rest'] *= 1.3
+        if ctx['bright']:
             # Bright light reduces rest need satisfaction
-            if env.lux > self.thresholds['lux_bright']:
-                rate *= 1.2
-            # Activity increases rest need
-            if env.motion_rms_g > self.thresholds['motion_active_g']:
-                rate *= 1.3
-                
-        elif need == 'social':
+            base_rates['rest'] *= 1.2
+        if ctx['novelty']:
             # Location changes suggest social opportunities
-            if self._detect_novelty(env, beast):
-                rate *= 0.8  # Slower drift when exploring
-                
-        elif need == 'hygiene':
+            base_rates['social'] *= 0.8  # Slower drift when exploring
+        if not ctx['comfortable']:
             # Environmental extremes increase hygiene need
-            if not self._is_comfortable_temperature(env.temp_c):
-                rate *= 1.2
-        
-        return rate
-    
-    def _apply_environmental_satisfaction(self, needs: Dict[str, float], env: EnvFeatures) -> Dict[str, float]:
-        """Apply environmental satisfaction to needs."""
-        
-        # Rest satisfaction from dark, quiet environment
-        if (env.lux < self.thresholds['lux_dark'] and 
-            env.motion_rms_g < self.thresholds['motion_active_g'] / 4):
-            needs['rest'] = min(100.0, needs['rest'] + 0.5)
-        
-        # Social satisfaction from location novelty (proxy for meeting others)
-        # This is simplified - full implementation would detect actual peers
-        
-        # Hygiene satisfaction from moderate conditions
-        if self._is_comfortable_temperature(env.temp_c) and 40 < env.rh < 70:
-            needs['hygiene'] = min(100.0, needs['hygiene'] + 0.2)
-        
-        return needs
-    
+            base_rates['hygiene'] *= 1.2
+
+        # Apply need drift over time in one vector op (base_rates is listed
+        # in NEED_KEYS storage order)
+        n = beast.needs
+        n.arr -= np.fromiter(base_rates.values(), dtype=np.float64) * \
+            (hours_passed * needs_config['drift_rate'])
+
+        # Apply actions that satisfy needs
+        for need in base_rates:
+            if need in actions:
+                n[need] += actions[need]
+
+        # Environmental need satisfaction; branchless - the booleans scale
+        # each bonus to zero and the clamp below caps at 100.
+        # Rest satisfaction from dark, quiet environment; hygiene from
+        # moderate conditions. Social satisfaction from location novelty
+        # would go here once actual peer detection exists.
+        n['rest'] += 0.5 * (ctx['dark'] and ctx['quiet'])
+        n['hygiene'] += 0.2 * (ctx['comfortable'] and 40 < env.rh < 70)
+
+        # Clamp the whole vector at once and refresh the cached aggregate
+        np.clip(n.arr, 0.0, 100.0, out=n.arr)
+        beast._needs_sum = float(n.arr.sum())
+
+        beast.last_updated = current_time
+        return beast
+
     def tick_traits(self, env: EnvFeatures, beast: Beast, actions: Dict = None) -> Beast:
         """Update beast traits based on experiences and actions."""
         if actions is None:
             actions = {}
-        
+        return self._tick_traits_inner(env, beast, actions,
+                                       self._env_context(env, beast))
+
+    def _tick_traits_inner(self, env: EnvFeatures, beast: Beast,
+                           actions: Dict, ctx: Dict) -> Beast:
+        """Traits update body, driven by precomputed environment flags."""
         # Trait learning rates (small increments)
         learning_rate = 0.01
-        
+
         # Playful trait - increases with activity and play actions
-        if (env.motion_rms_g > self.thresholds['motion_active_g'] or 
-            env.shake_events > 0 or 
-            'play' in actions):
+        if ctx['active'] or ctx['shaken'] or 'play' in actions:
             beast.traits['playful'] += learning_rate
-        
+
         # Needy trait - increases when needs are low
-        avg_need = sum(beast.needs.values()) / len(beast.needs)
+        avg_need = float(beast.needs.arr.mean())
         if avg_need < 40:
             beast.traits['needy'] += learning_rate
         elif avg_need > 70:
             beast.traits['needy'] -= learning_rate / 2
-        
+
         # Rebellious trait - increases with neglect or when needs ignored
-        if any(need < 20 for need in beast.needs.values()):
+        if beast.needs.arr.min() < 20:
             beast.traits['rebellious'] += learning_rate
-        
+
         # Social trait - would increase with peer interactions
         # Simplified for now since we don't have social system fully implemented
         if 'social_interaction' in actions:
             beast.traits['social'] += learning_rate
-        
+
         # Explorer trait - increases with location/environmental novelty
-        if self._detect_novelty(env, beast):
+        if ctx['novelty']:
             beast.traits['explorer'] += learning_rate
-        
-        # Clamp traits to valid range
-        for trait in beast.traits:
-            beast.traits[trait] = max(0.0, min(1.0, beast.traits[trait]))
-        
+
+        # Clamp the whole trait vector at once
+        t = beast.traits
+        np.clip(t.arr, 0.0, 1.0, out=t.arr)
+
         return beast
-    
+
     def update_evolution(self, env: EnvFeatures, beast: Beast, hours: int = 48) -> Beast:
         """Update evolution path and progression."""
+        return self._update_evolution_inner(env, beast,
+                                            self._env_context(env, beast))
+
+    def _update_evolution_inner(self, env: EnvFeatures, beast: Beast,
+                                ctx: Dict) -> Beast:
+        """Evolution update body, driven by precomputed environment flags."""
         # This is simplified - full implementation would use database history
-        
+
         # Calculate exposure scores (simplified heuristics)
         exposure_scores = {
             'sun': 0.0,
             'shadow': 0.0,
-            'ember': 0.0, 
+            'ember': 0.0,
             'frost': 0.0,
             'social': 0.0,
             'lone': 0.0
         }
-        
+
         # Sun path: bright + warm + active
-        if (env.lux > 1000 and 
-            env.temp_c > 20 and 
-            env.motion_rms_g > self.thresholds['motion_active_g'] / 2):
+        if (env.lux > 1000 and
+            env.temp_c > 20 and
+            env.motion_rms_g > self._motion_half):
             exposure_scores['sun'] += 1.0
-        
-        # Shadow path: dark + quiet + low motion  
-        if (env.lux < self.thresholds['lux_dark'] and
-            env.motion_rms_g < self.thresholds['motion_active_g'] / 4):
+
+        # Shadow path: dark + quiet + low motion
+        if ctx['dark'] and ctx['quiet']:
             exposure_scores['shadow'] += 1.0
-        
+
         # Ember path: hot temperatures
-        if env.temp_c > self.thresholds['temp_hot']:
+        if ctx['hot']:
             exposure_scores['ember'] += 1.0
-        
+
         # Frost path: cold temperatures
-        if env.temp_c < self.thresholds['temp_cold']:
+        if ctx['cold']:
             exposure_scores['frost'] += 1.0
-        
+
         # Social/lone paths (simplified - would need peer detection)
-        if env.motion_rms_g > self.thresholds['motion_active_g']:
+        if ctx['active']:
             exposure_scores['social'] += 0.5
         else:
             exposure_scores['lone'] += 0.5
-        
+
         # Select path with highest score (with hysteresis)
         current_score = exposure_scores.get(beast.evolution_path, 0.0)
         max_path = max(exposure_scores.items(), key=lambda x: x[1])
-        
+
         # Path switching with hysteresis
         if max_path[1] > current_score + 0.2:  # Require significant difference
             beast.evolution_path = max_path[0]
-        
+
         # Update progression
-        progression_rate = self.config.evolution.get('progression_rate', 0.01)
-        beast.evolution_prog += progression_rate * max(max(exposure_scores.values()), 0.1)
-        
+        beast.evolution_prog += self._progression_rate * max(max(exposure_scores.values()), 0.1)
+
         # Stage progression
-        stage_goal = self.config.evolution.get('stage_goal', 1.0)
-        if beast.evolution_prog >= stage_goal and beast.evolution_stage < 4:
+        if beast.evolution_prog >= self._stage_goal and beast.evolution_stage < 4:
             beast.evolution_stage += 1
             beast.evolution_prog = 0.0
             logger.info(f"Evolution stage up: {beast.evolution_path} stage {beast.evolution_stage}")
-        
+
         return beast
     
     def generate_tasks(self, beast: Beast, env: EnvFeatures) -> List[Dict]:
-        """Generate daily tasks based on deficits and traits."""
-        tasks = []
-        
-        # Need-based tasks
+        """Generate daily tasks based on deficits and traits (max 3)."""
+        # islice stops pulling from the generator once the cap is reached,
+        # so later conditions are never evaluated on the full-quota path
+        return list(islice(self._task_gen(beast, env), 3))
+
+    def _task_gen(self, beast: Beast, env: EnvFeatures):
+        """Yield candidate tasks in priority order."""
+        # Need-based tasks (shared frozen templates, no per-call allocation)
         for need, value in beast.needs.items():
             if value < 40:  # Need is low
-                if need == 'hunger':
-                    tasks.append({
-                        'type': 'care',
-                        'action': 'feed',
-                        'description': 'Feed your ByteBeast',
-                        'reward': {'hunger': 20}
-                    })
-                elif need == 'rest':
-                    tasks.append({
-                        'type': 'environment',
-                        'action': 'quiet_time',
-                        'description': 'Find a quiet spot for 15 minutes',
-                        'reward': {'rest': 15}
-                    })
-                elif need == 'social':
-                    tasks.append({
-                        'type': 'social',
-                        'action': 'meet_peer',
-                        'description': 'Take your ByteBeast to meet others',
-                        'reward': {'social': 25}
-                    })
-                elif need == 'hygiene':
-                    tasks.append({
-                        'type': 'care',
-                        'action': 'clean',
-                        'description': 'Keep your ByteBeast in comfortable conditions',
-                        'reward': {'hygiene': 20}
-                    })
-        
+                yield _NEED_TASKS[need]
+
         # Trait-based tasks
         if beast.traits['explorer'] > 0.7:
-            tasks.append({
-                'type': 'exploration',
-                'action': 'new_location',
-                'description': 'Take your ByteBeast somewhere new',
-                'reward': {'explorer_xp': 10}
-            })
-        
+            yield _TASK_EXPLORE
+
         if beast.traits['playful'] > 0.7:
-            tasks.append({
-                'type': 'activity',
-                'action': 'play_session',
-                'description': 'Have an active play session (shake/move around)',
-                'reward': {'playful_xp': 10}
-            })
-        
+            yield _TASK_PLAY
+
         # Environmental tasks
         if env.lux < 100:  # Very dark
-            tasks.append({
-                'type': 'environment',
-                'action': 'bright_spot',
-                'description': 'Find a bright spot for 10 minutes',
-                'reward': {'energy': 10}
-            })
-        
-        # Limit to reasonable number of tasks
-        return tasks[:3]
+            yield _TASK_BRIGHT
+
+
+# Built once at import; create_default_beast() hands out deep copies so the
+# constructor and range clamps don't re-run for every new beast (the tests
+# create one per setUp)
+_DEFAULT_BEAST_PROTOTYPE = Beast(
+    mood='calm',
+    needs={
+        'hunger': 75.0,
+        'rest': 60.0,
+        'social': 50.0,
+        'hygiene': 80.0
+    },
+    traits={
+        'playful': 0.5,
+        'needy': 0.3,
+        'rebellious': 0.2,
+        'social': 0.4,
+        'explorer': 0.6
+    },
+    evolution_path='sun',
+    evolution_stage=1,
+    evolution_prog=0.0,
+    energy=100.0,
+    last_updated=0.0
+)
 
 
 def create_default_beast() -> Beast:
     """Create a new ByteBeast with default values."""
-    return Beast(
-        mood='calm',
-        needs={
-            'hunger': 75.0,
-            'rest': 60.0,
-            'social': 50.0, 
-            'hygiene': 80.0
-        },
-        traits={
-            'playful': 0.5,
-            'needy': 0.3,
-            'rebellious': 0.2,
-            'social': 0.4,
-            'explorer': 0.6
-        },
-        evolution_path='sun',
-        evolution_stage=1,
-        evolution_prog=0.0,
-        energy=100.0,
-        last_updated=time.time()
-    )
\ No newline at end of file
+    beast = copy.deepcopy(_DEFAULT_BEAST_PROTOTYPE)
+    beast.last_updated = time.time()
+    return beast
\ No newline at end of file
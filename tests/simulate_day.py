@@ -5,11 +5,15 @@ ByteBeast Day Simulation
 Simulates a full day of ByteBeast operation for testing.
 """
 
+import copy
+import multiprocessing
 import time
 import sys
 import logging
 from pathlib import Path
 
+import numpy as np
+
 # Add bytebeast to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -28,6 +32,65 @@ logging.basicConfig(
 logger = logging.getLogger('bytebeast.simulation')
 
 
+# Per-hour time-of-day tables, computed once at import. The synthetic day
+# repeats every 24 hours, so multi-day runs index with hour % 24.
+_HOUR = np.arange(24)
+_SUN = np.sin((_HOUR - 6) * np.pi / 12)      # shared by light and temperature
+_DAY = (_HOUR >= 6) & (_HOUR <= 18)
+_AWAKE = (_HOUR >= 8) & (_HOUR <= 22)
+
+_LUX = np.where(_DAY, 5000.0 * _SUN + 1000.0, 50.0)
+_CCT_K = np.where(_DAY, 5500.0, 3000.0)
+_TEMP_C = 20.0 + 8.0 * _SUN
+_MOTION_RMS_G = np.where(_AWAKE, 0.1 + 0.2 * (_HOUR % 4) / 4, 0.05)
+_SHAKE_EVENTS = np.where(_AWAKE & (_HOUR % 3 == 0), 1, 0)
+
+
+def _apply_time_of_day(features, hour):
+    """Overwrite sensor features with the synthetic diurnal values."""
+    h = hour % 24
+    features.lux = float(_LUX[h])
+    features.cct_k = float(_CCT_K[h])
+    features.temp_c = float(_TEMP_C[h])
+    features.motion_rms_g = float(_MOTION_RMS_G[h])
+    features.shake_events = int(_SHAKE_EVENTS[h])
+    return features
+
+
+def simulate_hour_pure(beast, hour, sensor_manager, mood_engine):
+    """State-only version of DaySimulation.simulate_hour.
+
+    Takes a beast and returns the beast after one hour of ticks, with no
+    database writes, display updates, or logging - the building block for
+    running many independent beasts side by side.
+    """
+    for minute in range(0, 60, 10):
+        features = _apply_time_of_day(sensor_manager.read_all_sensors(), hour)
+        beast = mood_engine.step(features, beast)
+    return beast
+
+
+def _sweep_one(args):
+    """Worker for sweep(): one beast through a full run of pure updates."""
+    beast, hours = args
+    sensor_manager = MockSensorManager()
+    mood_engine = MoodEngine()
+    for hour in range(hours):
+        beast = simulate_hour_pure(beast, hour, sensor_manager, mood_engine)
+    return beast
+
+
+def sweep(beasts, hours=24, processes=None):
+    """Simulate many starting beasts in parallel for parameter sweeps.
+
+    Each beast's day is inherently sequential (state carries from hour to
+    hour), but separate beasts share nothing, so the sweep scales across
+    cores with a process pool.
+    """
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_sweep_one, [(beast, hours) for beast in beasts])
+
+
 class DaySimulation:
     """Simulate a day in the life of ByteBeast."""
     
@@ -53,107 +116,107 @@ class DaySimulation:
     
     def simulate_hour(self, hour_of_day: int):
         """Simulate one hour of operation."""
-        logger.info(f"=== Hour {hour_of_day}:00 ===")
-        
-        # Simulate multiple sensor readings per hour
+        # Skip f-string formatting in the tick loop when INFO is suppressed
+        # (long runs with the log redirected or quieted)
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        if log_info:
+            logger.info(f"=== Hour {hour_of_day}:00 ===")
+
+        # Simulate multiple sensor readings per hour; accumulate the hour's
+        # rows and bulk-insert them once at the end instead of one
+        # INSERT+commit round trip per tick
+        pending_sensors = []
+        pending_beasts = []
+
         for minute in range(0, 60, 10):  # Every 10 minutes
             # Read sensors
             features = self.sensor_manager.read_all_sensors()
-            
+
             # Adjust sensor data based on time of day
             features = self._adjust_for_time_of_day(features, hour_of_day, minute)
-            
-            # Save sensor data
-            self.db.save_sensor_data(features)
-            
+
+            # Queue sensor data for the end-of-hour flush
+            pending_sensors.append(features)
+
             # Process beast state
             old_mood = self.beast.mood
             old_stage = self.beast.evolution_stage
             old_path = self.beast.evolution_path
-            
-            # Update beast
-            self.beast.mood = self.mood_engine.infer_mood(features, self.beast)
-            self.beast = self.mood_engine.update_needs(self.beast, features)
-            self.beast = self.mood_engine.tick_traits(features, self.beast)
-            self.beast = self.mood_engine.update_evolution(features, self.beast)
-            
+
+            # Update beast in one fused engine pass
+            self.beast = self.mood_engine.step(features, self.beast)
+
             # Track changes
-            if self.beast.mood != old_mood:
-                logger.info(f"  Mood: {old_mood} -> {self.beast.mood}")
+            mood_changed = self.beast.mood != old_mood
+            evolution_changed = (self.beast.evolution_stage != old_stage or
+                                 self.beast.evolution_path != old_path)
+
+            if mood_changed:
+                if log_info:
+                    logger.info(f"  Mood: {old_mood} -> {self.beast.mood}")
                 self.mood_changes += 1
-            
-            if (self.beast.evolution_stage != old_stage or 
-                self.beast.evolution_path != old_path):
-                logger.info(f"  Evolution: {old_path} stage {old_stage} -> "
-                           f"{self.beast.evolution_path} stage {self.beast.evolution_stage}")
+
+            if evolution_changed:
+                if log_info:
+                    logger.info(f"  Evolution: {old_path} stage {old_stage} -> "
+                               f"{self.beast.evolution_path} stage {self.beast.evolution_stage}")
                 self.evolution_changes += 1
-            
-            # Save state
-            self.db.save_beast_state(self.beast)
-            
+
+            # Snapshot only when something observable changed, plus an
+            # end-of-hour checkpoint so load_latest_beast_state always sees
+            # recent needs/traits drift (copy - the beast keeps mutating
+            # through the rest of the hour)
+            if mood_changed or evolution_changed or minute == 50:
+                pending_beasts.append(copy.deepcopy(self.beast))
+
             # Update display
             emoji_frame = self.display_manager.create_emoji_frame(self.beast, features)
             self.display_manager.update_display(emoji_frame, features)
-            
+
             # Power management
             power_state = self.power_manager.read_power_state()
             policy = self.power_manager.get_power_policy(power_state)
-            
-            if minute == 0:  # Log once per hour
+
+            if log_info and minute == 0:  # Log once per hour
                 logger.info(f"  Status: {self.beast.mood}, "
-                           f"needs avg {sum(self.beast.needs.values())/len(self.beast.needs):.0f}%, "
+                           f"needs avg {self.beast._needs_sum/len(self.beast.needs):.0f}%, "
                            f"energy {self.beast.energy:.0f}%, "
                            f"battery {power_state.battery_percent:.0f}%")
+
+        # Flush the hour's rows in two executemany batches
+        self.db.save_sensor_data_batch(pending_sensors)
+        self.db.save_beast_state_batch(pending_beasts)
         
         # Generate hourly tasks
         tasks = self.mood_engine.generate_tasks(self.beast, features)
-        if tasks:
+        if tasks and log_info:
             logger.info(f"  Tasks: {[task['description'] for task in tasks[:2]]}")
     
     def _adjust_for_time_of_day(self, features, hour, minute):
-        """Adjust sensor features based on time of day.""" 
-        import math
-        
-        # Light levels - day/night cycle
-        if 6 <= hour <= 18:  # Daytime
-            base_lux = 5000
-            # Peak at noon
-            sun_factor = math.sin((hour - 6) * math.pi / 12)
-            features.lux = base_lux * sun_factor + 1000
-            features.cct_k = 5500
-        else:  # Nighttime
-            features.lux = 50
-            features.cct_k = 3000
-        
-        # Temperature variation
-        temp_cycle = math.sin((hour - 6) * math.pi / 12)
-        features.temp_c = 20 + 8 * temp_cycle
-        
-        # Motion patterns - more active during day
-        if 8 <= hour <= 22:
-            features.motion_rms_g = 0.1 + 0.2 * (hour % 4) / 4
-            features.shake_events = 1 if hour % 3 == 0 else 0
-        else:
-            features.motion_rms_g = 0.05
-            features.shake_events = 0
-        
-        return features
+        """Adjust sensor features based on time of day."""
+        return _apply_time_of_day(features, hour)
     
-    def run_simulation(self, hours: int = 24):
-        """Run full simulation."""
+    def run_simulation(self, hours: int = 24, interactive: bool = False):
+        """Run full simulation.
+
+        With interactive=True a short pause is inserted between hours so the
+        log is watchable; tests and CI leave it off and run at full speed.
+        """
         logger.info(f"Starting {hours}-hour ByteBeast simulation")
         logger.info(f"Initial state: {self.beast.mood} mood, "
                    f"{self.beast.evolution_path} path stage {self.beast.evolution_stage}")
         
         start_time = time.time()
-        
+
         for hour in range(hours):
             try:
                 self.simulate_hour(hour)
-                
-                # Brief pause for realism
-                time.sleep(0.1)
-                
+
+                # Brief pause for realism when someone is watching
+                if interactive:
+                    time.sleep(0.1)
+
             except KeyboardInterrupt:
                 logger.info("Simulation interrupted by user")
                 break
@@ -204,7 +267,7 @@ def main():
             print("Invalid hours argument, using 24")
     
     simulation = DaySimulation()
-    results = simulation.run_simulation(hours)
+    results = simulation.run_simulation(hours, interactive=True)
     
     print(f"\nSimulation Results:")
     print(f"  Duration: {hours} hours")
@@ -4,7 +4,6 @@ Integration tests for ByteBeast system.
 """
 
 import unittest
-import tempfile
 import sys
 from pathlib import Path
 
@@ -22,18 +21,29 @@ from core.config import Config
 class TestIntegration(unittest.TestCase):
     """Integration tests for ByteBeast components."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Use temporary database
-        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
-        self.db = ByteBeastDB(self.temp_db.name)
-        
+    @classmethod
+    def setUpClass(cls):
+        """Build shared fixtures once - component construction and the DB
+        schema migration are identical for every test."""
+        # Nothing here needs cross-process persistence, so keep the
+        # database entirely in memory - no filesystem I/O or fsync cost
+        cls.db = ByteBeastDB(':memory:')
+
         # Initialize components in mock mode
-        self.sensor_manager = MockSensorManager()
-        self.mood_engine = MoodEngine()
-        self.display_manager = MockDisplayManager()
-        self.power_manager = MockPowerManager()
-        
+        cls.sensor_manager = MockSensorManager()
+        cls.mood_engine = MoodEngine()
+        cls.display_manager = MockDisplayManager()
+        cls.power_manager = MockPowerManager()
+
+    def setUp(self):
+        """Reset mutable state for each test."""
+        # Clear table contents instead of recreating the database
+        with self.db.get_connection() as conn:
+            conn.execute('DELETE FROM state_snapshot')
+            conn.execute('DELETE FROM history_sense')
+            conn.execute('DELETE FROM history_events')
+            conn.commit()
+
         # Create test beast
         self.beast = create_default_beast()
     
@@ -116,11 +126,8 @@ class TestIntegration(unittest.TestCase):
         features = self.sensor_manager.read_all_sensors()
         self.db.save_sensor_data(features)
         
-        # 2. State processing
-        self.beast.mood = self.mood_engine.infer_mood(features, self.beast)
-        self.beast = self.mood_engine.update_needs(self.beast, features)
-        self.beast = self.mood_engine.tick_traits(features, self.beast)
-        self.beast = self.mood_engine.update_evolution(features, self.beast)
+        # 2. State processing - one fused engine pass
+        self.beast = self.mood_engine.step(features, self.beast)
         self.db.save_beast_state(self.beast)
         
         # 3. Power management
@@ -175,21 +182,17 @@ class TestIntegration(unittest.TestCase):
         display_config = config.display
         self.assertIn('fps_active', display_config, "Display config should have fps_active")
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Close and remove temporary database
-        import os
-        self.temp_db.close()
-        os.unlink(self.temp_db.name)
-
-
 class TestSystemBehavior(unittest.TestCase):
     """Test system behavior scenarios."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build shared stateless fixtures once."""
+        cls.sensor_manager = MockSensorManager()
+        cls.mood_engine = MoodEngine()
+
     def setUp(self):
-        """Set up test scenario."""
-        self.sensor_manager = MockSensorManager()
-        self.mood_engine = MoodEngine()
+        """Set up a fresh beast for each scenario."""
         self.beast = create_default_beast()
     
     def test_hot_environment_scenario(self):
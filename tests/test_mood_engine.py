@@ -3,6 +3,7 @@
 Test suite for ByteBeast mood inference engine.
 """
 
+import dataclasses
 import unittest
 import sys
 from pathlib import Path
@@ -13,31 +14,49 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.models import EnvFeatures, Beast
 from state.mood_engine import MoodEngine, create_default_beast
 
+# Canonical sensor reading for "normal" conditions; individual tests override
+# just the fields they exercise via _base_env instead of re-listing all 18
+# constructor arguments
+_DEFAULT_ENV = EnvFeatures(
+    lux=1000.0,
+    cct_k=5000.0,
+    temp_c=20.0,
+    rh=50.0,
+    pressure_hpa=1013.0,
+    pressure_trend=0.0,
+    motion_rms_g=0.1,
+    shake_events=0,
+    heading_deg=180.0,
+    roll=0.0, pitch=0.0, yaw=0.0,
+    vbat=4.0, ibat=100.0, pwr_w=0.4,
+    charging=False,
+    ssid_fingerprint="test",
+    timestamp=0
+)
+
+
+def _base_env(**overrides) -> EnvFeatures:
+    """Return a fresh default EnvFeatures with selected fields overridden."""
+    return dataclasses.replace(_DEFAULT_ENV, **overrides)
+
 
 class TestMoodEngine(unittest.TestCase):
     """Test mood inference engine."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the engine once - it holds no per-test state."""
+        cls.engine = MoodEngine()
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.engine = MoodEngine()
+        """Set up a fresh beast for each test."""
         self.beast = create_default_beast()
     
     def test_hot_mood_rule(self):
         """Test hot temperature rule has priority."""
-        env = EnvFeatures(
+        env = _base_env(
             temp_c=35.0,  # Above hot threshold (30°C)
-            lux=5000.0,   # Bright light  
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.1,
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+            lux=5000.0    # Bright light
         )
         
         mood = self.engine.infer_mood(env, self.beast)
@@ -45,20 +64,9 @@ class TestMoodEngine(unittest.TestCase):
     
     def test_cold_mood_rule(self):
         """Test cold temperature rule has priority."""
-        env = EnvFeatures(
+        env = _base_env(
             temp_c=5.0,   # Below cold threshold (10°C)
-            lux=5000.0,   # Bright light (would normally be happy)
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.1,
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+            lux=5000.0    # Bright light (would normally be happy)
         )
         
         mood = self.engine.infer_mood(env, self.beast)
@@ -66,21 +74,9 @@ class TestMoodEngine(unittest.TestCase):
     
     def test_sick_mood_low_battery(self):
         """Test sick mood from low battery."""
-        env = EnvFeatures(
-            temp_c=20.0,  # Normal temperature
-            lux=1000.0,   # Normal light
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.1,
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=3.2,     # Low battery voltage
-            ibat=100.0, pwr_w=0.32,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+        env = _base_env(
+            vbat=3.2,   # Low battery voltage
+            pwr_w=0.32
         )
         
         mood = self.engine.infer_mood(env, self.beast)
@@ -88,20 +84,9 @@ class TestMoodEngine(unittest.TestCase):
     
     def test_playful_mood_shake(self):
         """Test playful mood from shake events.""" 
-        env = EnvFeatures(
-            temp_c=20.0,
-            lux=1000.0,
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
+        env = _base_env(
             motion_rms_g=0.3,  # High motion
-            shake_events=2,    # Shake events
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+            shake_events=2     # Shake events
         )
         
         mood = self.engine.infer_mood(env, self.beast)
@@ -111,20 +96,10 @@ class TestMoodEngine(unittest.TestCase):
         """Test happy mood from bright, comfortable conditions."""
         self.beast.energy = 80.0  # High energy
         
-        env = EnvFeatures(
-            temp_c=22.0,    # Comfortable temperature
-            lux=10000.0,    # Bright light (above threshold)
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.05,  # Low motion
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+        env = _base_env(
+            temp_c=22.0,      # Comfortable temperature
+            lux=10000.0,      # Bright light (above threshold)
+            motion_rms_g=0.05 # Low motion
         )
         
         mood = self.engine.infer_mood(env, self.beast)
@@ -132,21 +107,12 @@ class TestMoodEngine(unittest.TestCase):
     
     def test_calm_fallback(self):
         """Test calm mood as fallback."""
-        env = EnvFeatures(
-            temp_c=20.0,    # Normal temperature
-            lux=1000.0,     # Normal light
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.1,   # Normal motion
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
-        )
+        env = _base_env()  # Normal conditions across the board
+
+        # Normal conditions are only calm once they are familiar - prime the
+        # novelty tracker so the curious rule does not fire first
+        self.beast._last_lux = env.lux
+        self.beast._last_fingerprint = env.ssid_fingerprint
         
         mood = self.engine.infer_mood(env, self.beast)
         self.assertEqual(mood, 'calm', "Normal conditions should default to calm mood")
@@ -159,13 +125,7 @@ class TestMoodEngine(unittest.TestCase):
         import time
         self.beast.last_updated = time.time() - 3600  # 1 hour ago
         
-        env = EnvFeatures(
-            temp_c=20.0, lux=1000.0, rh=50.0, pressure_hpa=1013.0,
-            pressure_trend=0.0, motion_rms_g=0.1, shake_events=0,
-            heading_deg=180.0, roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4, charging=False,
-            ssid_fingerprint="test", timestamp=0
-        )
+        env = _base_env()
         
         updated_beast = self.engine.update_needs(self.beast, env)
         
@@ -177,13 +137,7 @@ class TestMoodEngine(unittest.TestCase):
         """Test that traits change based on actions."""
         original_playful = self.beast.traits['playful']
         
-        env = EnvFeatures(
-            temp_c=20.0, lux=1000.0, rh=50.0, pressure_hpa=1013.0,
-            pressure_trend=0.0, motion_rms_g=0.5, shake_events=1,  # Active
-            heading_deg=180.0, roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4, charging=False,
-            ssid_fingerprint="test", timestamp=0
-        )
+        env = _base_env(motion_rms_g=0.5, shake_events=1)  # Active
         
         actions = {'play': True}
         updated_beast = self.engine.tick_traits(env, self.beast, actions)
@@ -196,20 +150,10 @@ class TestMoodEngine(unittest.TestCase):
         """Test evolution progression."""
         original_prog = self.beast.evolution_prog
         
-        env = EnvFeatures(
-            temp_c=25.0,    # Warm
-            lux=8000.0,     # Bright  
-            rh=50.0,
-            pressure_hpa=1013.0,
-            pressure_trend=0.0,
-            motion_rms_g=0.3,   # Active (sun path conditions)
-            shake_events=0,
-            heading_deg=180.0,
-            roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4,
-            charging=False,
-            ssid_fingerprint="test",
-            timestamp=0
+        env = _base_env(
+            temp_c=25.0,      # Warm
+            lux=8000.0,       # Bright
+            motion_rms_g=0.3  # Active (sun path conditions)
         )
         
         updated_beast = self.engine.update_evolution(env, self.beast)
@@ -222,13 +166,7 @@ class TestMoodEngine(unittest.TestCase):
         """Test task generation for low needs.""" 
         self.beast.needs['hunger'] = 20.0  # Low hunger
         
-        env = EnvFeatures(
-            temp_c=20.0, lux=1000.0, rh=50.0, pressure_hpa=1013.0,
-            pressure_trend=0.0, motion_rms_g=0.1, shake_events=0,
-            heading_deg=180.0, roll=0.0, pitch=0.0, yaw=0.0,
-            vbat=4.0, ibat=100.0, pwr_w=0.4, charging=False,
-            ssid_fingerprint="test", timestamp=0
-        )
+        env = _base_env()
         
         tasks = self.engine.generate_tasks(self.beast, env)
         